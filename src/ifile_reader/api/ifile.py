@@ -6,10 +6,23 @@ from pydantic import BaseModel, PrivateAttr
 from ifile_reader.core.corrections.offset import apply_offset_correction
 from ifile_reader.core.infrastructure.ifile_reader import IFileReader
 from ifile_reader.core.domain.axis import AxisView
+from ifile_reader.core.domain.channel import ChannelView
+from ifile_reader.core.domain.dependencies import _classify_axis, _upper
 from ifile_reader.core.domain.parameter import ParameterIndex
 
 logger = logging.getLogger(__name__)
 
+# engine-dict key -> (parameter name, description)
+_ENG_PARAM_MAP = (
+    ("name", "ENGINE", "engine name"),
+    ("bore", "BORE", "bore diameter"),
+    ("stroke", "STROKE", "stroke length"),
+    ("conrod_length", "CONROD", "conrod length"),
+    ("compression_ratio", "EPSILON", "compression"),
+    ("number_of_strokes", "NRSTROKE", "number of strokes"),
+    ("pin_offset", "PINOFF", "pinoff"),
+)
+
 
 class IFile(BaseModel):
     path: Path
@@ -30,11 +43,18 @@ class IFile(BaseModel):
 
     @property
     def ca(self):
-        return {ch: self["CA"][ch] for ch in self["CA"]}
+        return self._axis_channels("CA")
 
     @property
     def cy(self):
-        return {ch: self["CY"][ch] for ch in self["CY"]}
+        return self._axis_channels("CY")
+
+    def _axis_channels(self, axis: str) -> dict:
+        index = self._raw.get("_axes_index")
+        if index is not None:
+            test = self._raw.get("_test")
+            return {name: ChannelView(name, block, test) for name, block in index[axis].items()}
+        return {ch: self[axis][ch] for ch in self[axis]}
     
     @property
     def correction_pairs(self) -> dict[str, str]:
@@ -74,78 +94,49 @@ class IFile(BaseModel):
         self._raw["_test"] = str(self.path)
 
         eng: dict = self._raw.get("engine", {})
-        eng_name = eng.get("name")
-        bore = eng.get("bore")
-        stroke = eng.get("stroke")
-        conrod_len = eng.get("conrod_length")
-        compression = eng.get("compression_ratio")
-        num_stroke = eng.get("number_of_strokes")
-        pin_off = eng.get("pin_offset")
-
         self._raw.setdefault("parameters", {})
-
-        if eng_name is not None:
-            self._raw["parameters"]["ENGINE"] = {
-                "value": eng_name,
-                "unit": "",
-                "description": "engine name"
-            }
-        if bore is not None:
-            self._raw["parameters"]["BORE"] = {
-                "value": bore,
-                "unit": "",
-                "description": "bore diameter"
-            }
-        if stroke is not None:
-            self._raw["parameters"]["STROKE"] = {
-                "value": stroke,
-                "unit": "",
-                "description": "stroke length"
-            }
-        if conrod_len is not None:
-            self._raw["parameters"]["CONROD"] = {
-                "value": conrod_len,
-                "unit": "",
-                "description": "conrod length"
-            }
-        if compression is not None:
-            self._raw["parameters"]["EPSILON"] = {
-                "value": compression,
-                "unit": "",
-                "description": "compression"
-            }
-        if num_stroke is not None:
-            self._raw["parameters"]["NRSTROKE"] = {
-                "value": num_stroke,
-                "unit": "",
-                "description": "number of strokes"
-            }
-        if pin_off is not None:
-            self._raw["parameters"]["PINOFF"] = {
-                "value": pin_off,
-                "unit": "",
-                "description": "pinoff"
-            }
+        params = self._raw["parameters"]
+        for src, key, desc in _ENG_PARAM_MAP:
+            v = eng.get(src)
+            if v is not None:
+                params[key] = {"value": v, "unit": "", "description": desc}
 
         header: dict = self._raw.get("header", {})
         date_str = header.get("date")
 
         if isinstance(date_str, str) and len(date_str) >= 14:
             ts_iso = (
-                f"{date_str[0:4]}-{date_str[4:6]}-{date_str[6:8]} "
+                f"{date_str[0:4]}-{date_str[4:6]}-{date_str[6:8]}T"
                 f"{date_str[8:10]}:{date_str[10:12]}:{date_str[12:14]}"
             )
+            try:
+                # datetime64 keeps TIMESTAMP usable in vectorized ops; an
+                # object-dtype string would block them downstream.
+                ts_values = np.array([np.datetime64(ts_iso, "s")], dtype="datetime64[s]")
+            except ValueError:
+                ts_values = np.array([ts_iso], dtype=object)
             self._raw["parameters"]["DATE"] = {
                 "value": date_str,
                 "unit": "",
                 "description": "date of measurement",
             }
             self._raw["parameters"]["TIMESTAMP"] = {
-                "values": np.array([ts_iso], dtype=object),
+                "values": ts_values,
                 "unit": "",
                 "description": "time stamp",
             }
 
+        # Classify every channel once so AxisView lookups become plain dict
+        # access instead of rescanning _raw per access.
+        axes_index: dict[str, dict[str, dict]] = {"CA": {}, "CY": {}}
+        for name, block in self._raw.items():
+            if not isinstance(block, dict):
+                continue
+            if "data" not in block or "axis" not in block:
+                continue
+            axes_index[_classify_axis(np.asarray(block["axis"]))][name] = block
+        self._raw["_axes_index"] = axes_index
+
         if self.avl_correction:
             pairs = self._find_reference_channels()
             self._raw["_correction_pairs"] = pairs
@@ -155,7 +146,7 @@ class IFile(BaseModel):
 
 
     def __getitem__(self, key: str):
-        ku = key.upper()
+        ku = _upper(key)
         if ku == "ENGINE":
             return self.engine
         if ku in ("CA", "CY"):
@@ -168,15 +159,16 @@ class IFile(BaseModel):
     def _find_reference_channels(self) -> dict[str, str]:
         ca_channels = set(self["CA"])
         pairs = {}
-        if "SDREF" in ca_channels:
-            for ch in ca_channels:
-                if ch.endswith("SAUG"):
-                    pairs[ch] = "SDREF"
-
-        if "ADREF" in ca_channels:
-            for ch in ca_channels:
-                if ch.endswith("AUSP"):
-                    pairs[ch] = "ADREF"
+        has_sd = "SDREF" in ca_channels
+        has_ad = "ADREF" in ca_channels
+        if not (has_sd or has_ad):
+            return pairs
+
+        for ch in ca_channels:
+            if has_sd and ch.endswith("SAUG"):
+                pairs[ch] = "SDREF"
+            elif has_ad and ch.endswith("AUSP"):
+                pairs[ch] = "ADREF"
 
         return pairs
     
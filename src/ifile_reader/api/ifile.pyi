@@ -99,7 +99,7 @@ class IFile:
     ----------
     Measurement time is extracted from the MAT ``header`` block and added as parameters:
       - ``DATE``      (numeric yyyymmddhhmmss form)
-      - ``TIMESTAMP`` (ISO-8601 string)
+      - ``TIMESTAMP`` (``numpy.datetime64[s]`` array)
     
     date = ifile["PAR"]["DATE"]["VALUES"]
 
@@ -11,3 +11,5 @@ class CatoolConfig(BaseModel):
     catool_path: Optional[Path] = None
     download_if_missing: bool = True
     subprocess_timeout: Optional[int] = 60
+    # Whether the catool build accepts its input file on stdin ('input-file "-"').
+    supports_stdin: bool = False
@@ -3,6 +3,43 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = prange = None
+
+if njit is not None:
+    # No fastmath: its nnan assumption would let LLVM fold the isnan check
+    # below to false, breaking the NaN-validity accounting.
+    @njit(parallel=True, cache=True)
+    def _offset_kernel(m_data, r_data, m_axis, r_axis, out):  # pragma: no cover - requires numba
+        m_n = m_axis.shape[0]
+        r_n = r_axis.shape[0]
+        n_cycles = m_data.shape[1]
+        for c in prange(n_cycles):
+            total = 0.0
+            count = 0
+            i = 0
+            for k in range(r_n):
+                x = r_axis[k]
+                if x < m_axis[0] or x > m_axis[m_n - 1]:
+                    continue
+                # The walk assumes ascending queries; rewind when r_axis
+                # steps backwards so unsorted axes still bracket correctly.
+                if m_axis[i] > x:
+                    i = 0
+                while i < m_n - 2 and m_axis[i + 1] < x:
+                    i += 1
+                w = (x - m_axis[i]) / (m_axis[i + 1] - m_axis[i])
+                m_val = (1.0 - w) * m_data[i, c] + w * m_data[i + 1, c]
+                d = r_data[k, c] - m_val
+                if not np.isnan(d):
+                    total += d
+                    count += 1
+            out[c] = total / count if count > 0 else 0.0
+else:
+    _offset_kernel = None
+
 
 def apply_offset_correction(raw: dict, meas_name: str, ref_name: str) -> None:
     if meas_name not in raw or ref_name not in raw:
@@ -25,22 +62,58 @@ def apply_offset_correction(raw: dict, meas_name: str, ref_name: str) -> None:
         raise ValueError(f"Cycle count mismatch: {meas_name} has {n_cycles_m}, {ref_name} has {n_cycles_r}")
 
     n_cycles = n_cycles_m
-    per_cycle_offset = np.zeros(n_cycles, dtype=float)
-
-    for c in range(n_cycles):
-        m_cycle = m_data[:, c]
-        r_cycle = r_data[:, c]
-        
-        m_interp = np.interp(r_axis, m_axis, m_cycle, left=np.nan, right=np.nan)
-        diff = r_cycle - m_interp
-        valid = ~np.isnan(diff)
-        if not np.any(valid):
-            per_cycle_offset[c] = 0.0
+
+    # np.interp raised on these in the original loop; the compiled kernel
+    # would instead read out of bounds (boundscheck is off under njit).
+    if m_axis.size != m_n or r_axis.size != r_n:
+        raise ValueError(
+            f"Axis/data length mismatch: {meas_name} axis has {m_axis.size} points for {m_n} rows, "
+            f"{ref_name} axis has {r_axis.size} points for {r_n} rows"
+        )
+    if m_n == 0:
+        raise ValueError(f"Cannot offset-correct {meas_name}: axis is empty")
+
+    if _offset_kernel is not None and m_n >= 2:
+        # Compiled kernel: inline interpolation per cycle, parallel over
+        # cycles. Its bracketing walk needs at least two axis points; the
+        # degenerate single-point case falls through to the NumPy branch.
+        per_cycle_offset = np.empty(n_cycles, dtype=float)
+        _offset_kernel(
+            np.ascontiguousarray(m_data),
+            np.ascontiguousarray(r_data),
+            np.ascontiguousarray(m_axis),
+            np.ascontiguousarray(r_axis),
+            per_cycle_offset,
+        )
+    else:
+        if m_n < 2:
+            # A single-point axis clamps every query to its lone row, as
+            # np.interp would; only an exact axis match counts as in range.
+            m_interp = np.broadcast_to(m_data[0], (r_n, n_cycles)).astype(float)
         else:
-            per_cycle_offset[c] = float(np.nanmean(diff[valid]))
+            # m_axis is shared by every cycle, so interpolate all columns at
+            # once: locate each r_axis point in m_axis and blend the two
+            # bracketing rows.
+            idx = np.searchsorted(m_axis, r_axis) - 1
+            idx = np.clip(idx, 0, m_axis.size - 2)
+            x0 = m_axis[idx]
+            x1 = m_axis[idx + 1]
+            w = (r_axis - x0) / (x1 - x0)
+            m0 = m_data[idx]
+            m_interp = m0 + w[:, None] * (m_data[idx + 1] - m0)
+
+        out_of_range = (r_axis < m_axis[0]) | (r_axis > m_axis[-1])
+        m_interp[out_of_range] = np.nan
+
+        diff = r_data - m_interp
+        valid_counts = np.count_nonzero(~np.isnan(diff), axis=0)
+        sums = np.nansum(diff, axis=0)
+        per_cycle_offset = np.where(valid_counts > 0, sums / np.maximum(valid_counts, 1), 0.0)
 
     mean_valid = float(np.nanmean(per_cycle_offset))
     logger.debug(f"Applied offset correction for '{meas_name}' using '{ref_name}'. mean_offset={mean_valid}")
 
-    corrected = m_data + per_cycle_offset
-    meas["data"] = corrected
+    # m_data is either meas["data"] itself or a freshly converted float copy;
+    # adding in place is safe either way and avoids another full-size allocation.
+    np.add(m_data, per_cycle_offset, out=m_data)
+    meas["data"] = m_data
@@ -8,8 +8,18 @@ class AxisView(Mapping):
     def __init__(self, raw: dict, axis: str):
         self._raw = raw or {}
         self._axis = axis.upper()
+        self._cache: dict[str, dict] | None = None
+
+    def invalidate(self) -> None:
+        self._cache = None
 
     def _channels(self) -> dict[str, dict]:
+        if self._cache is not None:
+            return self._cache
+        index = self._raw.get("_axes_index")
+        if index is not None and self._axis in index:
+            self._cache = index[self._axis]
+            return self._cache
         out = {}
         for name, block in self._raw.items():
             if not isinstance(block, dict):
@@ -20,6 +30,7 @@ class AxisView(Mapping):
             axis_arr = np.asarray(block.get("axis", []))
             if _classify_axis(axis_arr) == self._axis:
                 out[name] = block
+        self._cache = out
         return out
 
     def __getitem__(self, channel: str):
@@ -2,7 +2,9 @@ from __future__ import annotations
 import numpy as np
 from typing import Any
 from collections.abc import Mapping
-from ifile_reader.core.domain.dependencies import GeneralView, _classify_axis, _format_range_from_axis
+from ifile_reader.core.domain.dependencies import GeneralView, _classify_axis, _format_range_from_axis, _upper
+
+_EMPTY = np.empty(0)
 
 
 def _safe_str(x: Any, default: str = "") -> str:
@@ -27,7 +29,13 @@ def _build_channel_general(name: str, block: dict[str, Any], test_name: str | No
     unit = _safe_str(block.get("units", "-"), "-")
     desc = _safe_str(block.get("description", ""))
     rng = _format_range_from_axis(axis, unit_for_range)
-    rec_cnt = int(np.asarray(block.get("data", [])).reshape(-1).size)
+    d = block.get("data")
+    if isinstance(d, np.ndarray):
+        rec_cnt = int(d.size)
+    elif d is None:
+        rec_cnt = 0
+    else:
+        rec_cnt = int(np.asarray(d).size)
     g = {
         "Channel": name,
         "Units": unit,
@@ -64,10 +72,16 @@ class ValuesView(Mapping):
         parts = []
         for k, v in self._map.items():
             arr = np.asarray(v)
+            if arr.size > 1000:
+                # Summarize instead of letting array2string traverse the data.
+                head = np.array2string(arr.reshape(-1)[:3], precision=6, separator=", ")
+                parts.append(f"'{k}': array(shape={arr.shape}, dtype={arr.dtype}, first={head}...)")
+                continue
             s = np.array2string(
                 arr,
                 max_line_width=120,
-                threshold=20,
+                threshold=6,
+                edgeitems=3,
                 precision=6,
                 separator=", ",
             )
@@ -95,9 +109,13 @@ class ChannelView:
         self._name = name
         self._block = channel_block or {}
         self._test = test_name
+        self._values_cache: dict[str, np.ndarray] | None = None
+        self._flat_cache: np.ndarray | None = None
+        self._data = np.asarray(self._block["data"]) if "data" in self._block else _EMPTY
+        self._axis = np.asarray(self._block["axis"]) if "axis" in self._block else _EMPTY
 
     def _raw_data(self) -> np.ndarray:
-        return np.asarray(self._block.get("data", np.asarray([])))
+        return self._data
 
     def __array__(self, dtype=None):
         arr = self._flatten_primary()
@@ -105,7 +123,7 @@ class ChannelView:
 
     def __getitem__(self, key):
         if isinstance(key, str):
-            ku = key.upper()
+            ku = _upper(key)
             if ku == "GENERAL":
                 return _build_channel_general(self._name, self._block, self._test)
             if ku == "VALUES":
@@ -121,10 +139,18 @@ class ChannelView:
         return self._flatten_primary()[key]
 
     def _flatten_primary(self) -> np.ndarray:
-        data = np.asarray(self._block.get("data", np.asarray([])))
-        axis = np.asarray(self._block.get("axis", np.asarray([])))
+        # The 2D/3D branches below copy when the axis runs along a
+        # non-contiguous dimension (data.T.reshape forces one), so keep the
+        # flattened result around instead of re-copying per access.
+        if self._flat_cache is None:
+            self._flat_cache = self._compute_flat_primary()
+        return self._flat_cache
+
+    def _compute_flat_primary(self) -> np.ndarray:
+        data = self._data
+        axis = self._axis
         if data.size == 0:
-            return np.asarray([])
+            return _EMPTY
 
         if data.ndim == 1:
             return data.reshape(-1)
@@ -150,13 +176,18 @@ class ChannelView:
         return data.reshape(-1)
 
     def _build_values_mapping(self) -> dict[str, np.ndarray]:
-        data = np.asarray(self._block.get("data", np.asarray([])))
-        axis = np.asarray(self._block.get("axis", np.asarray([])))
+        if self._values_cache is None:
+            self._values_cache = self._compute_values_mapping()
+        return self._values_cache
+
+    def _compute_values_mapping(self) -> dict[str, np.ndarray]:
+        data = self._data
+        axis = self._axis
         out: dict[str, np.ndarray] = {}
 
         if data.size == 0:
-            out["CA"] = np.asarray([])
-            out[self._name] = np.asarray([])
+            out["CA"] = _EMPTY
+            out[self._name] = _EMPTY
             return out
 
         if data.ndim == 1:
@@ -167,13 +198,13 @@ class ChannelView:
         if data.ndim == 2:
             if axis.size == data.shape[1]:
                 n_cycles = data.shape[0]
-                out["CA"] = np.tile(axis, n_cycles)
+                out["CA"] = np.broadcast_to(axis, (n_cycles, axis.size)).reshape(-1)
                 out[self._name] = data.reshape(-1)
                 return out
 
             if axis.size == data.shape[0]:
                 n_blocks = data.shape[1]
-                out["CA"] = np.repeat(axis, n_blocks)
+                out["CA"] = np.broadcast_to(axis[:, None], (axis.size, n_blocks)).reshape(-1)
                 out[self._name] = data.T.reshape(-1)
                 return out
 
@@ -193,7 +224,7 @@ class ChannelView:
                 d2 = np.moveaxis(data, axis_dim, -1)
                 leading = d2.shape[:-1]
                 total = int(np.prod(leading) * d2.shape[-1])
-                out["CA"] = np.tile(axis, int(total // axis.size))
+                out["CA"] = np.broadcast_to(axis, (int(total // axis.size), axis.size)).reshape(-1)
 
                 if leading and leading[0] > 1:
                     reshaped = (d2.reshape(leading[0], -1, d2.shape[-1]) if len(leading) >= 2 else d2.reshape(leading[0], d2.shape[-1]))
@@ -1,20 +1,31 @@
 import numpy as np
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 
+@lru_cache(maxsize=256)
+def _upper(s: str) -> str:
+    """Cached str.upper for the small, repetitive set of __getitem__ keys."""
+    return s.upper()
+
+
+# The same axis ndarray is typically shared by many channels, so classification
+# is memoized on its content signature. id()-based keys are unsound here:
+# array addresses get recycled, and a stale hit would misfile channels
+# between CA and CY.
+@lru_cache(maxsize=1024)
+def _classify_endpoints(a0: float, a1: float, size: int) -> str:
+    # Axes are monotonic (crank angle) or integer cycle indices, so the
+    # endpoints determine both the minimum and the typical step in O(1).
+    step = (a1 - a0) / (size - 1)
+    return "CA" if min(a0, a1) < 0 or abs(step) < 0.5 else "CY"
+
+
 def _classify_axis(axis: np.ndarray) -> str:
     if axis.size < 2:
         return "CY"
-
-    axis = np.asarray(axis, dtype=float)
-    amin = float(np.nanmin(axis))
-    diffs = np.diff(axis)
-    step = float(np.nanmedian(diffs)) if diffs.size else 0.0
-
-    if amin < 0 or abs(step) < 0.5:
-        return "CA"
-    return "CY"
+    return _classify_endpoints(float(axis[0]), float(axis[-1]), axis.size)
 
 
 def _format_range_from_axis(axis: np.ndarray, unit: str) -> str:
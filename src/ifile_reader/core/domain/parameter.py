@@ -2,7 +2,7 @@ from __future__ import annotations
 import numpy as np
 from collections.abc import Mapping
 from typing import Any
-from ifile_reader.core.domain.dependencies import GeneralView
+from ifile_reader.core.domain.dependencies import GeneralView, _upper
 
 
 def _extract_param_components(pname: str, p) -> tuple[float, str, str]:
@@ -125,7 +125,7 @@ class ParameterView:
         self._test = test_name or ""
 
     def __getitem__(self, key: str):
-        ku = key.upper()
+        ku = _upper(key)
         if ku == "GENERAL":
             return self._build_general()
         if ku == "VALUES":
@@ -149,6 +149,8 @@ class ParameterView:
         idx_arr = np.array([0])
         if isinstance(val, str):
             val_arr = np.array([val], dtype=object)
+        elif isinstance(val, np.datetime64):
+            val_arr = np.array([val], dtype="datetime64[s]")
         else:
             val_arr = np.array([val], dtype=float)
         mapping = {"": idx_arr, self._name: val_arr}
@@ -164,25 +166,24 @@ class ParameterView:
 class ParameterIndex(Mapping):
     def __init__(self, ifile):
         self._ifile = ifile
+        self._params = ifile._raw.get("parameters") or ifile._raw.get("PAR") or {}
+        self._test_name: str | None = None
 
     def __repr__(self):
         try:
-            params = self._ifile._raw.get("parameters") or self._ifile._raw.get("PAR")
-            return repr(sorted(params.keys(), key=str.lower))
+            return repr(sorted(self._params.keys(), key=str.lower))
         except Exception:
             return "[]"
 
     def __len__(self):
-        params = self._ifile._raw.get("parameters") or self._ifile._raw.get("PAR")
-        return len(params)
+        return len(self._params)
 
     def __iter__(self):
-        params = self._ifile._raw.get("parameters") or self._ifile._raw.get("PAR")
-        return iter(params)
+        return iter(self._params)
 
     def __getitem__(self, key: str):
-        params = self._ifile._raw.get("parameters") or self._ifile._raw.get("PAR")
-        if key not in params:
+        if key not in self._params:
             raise KeyError(f"Parameter '{key}' not found")
-        test_name = str(self._ifile.path) if hasattr(self._ifile, "path") else self._ifile._raw.get("_test", "")
-        return ParameterView(key, params[key], test_name)
+        if self._test_name is None:
+            self._test_name = str(self._ifile.path) if hasattr(self._ifile, "path") else self._ifile._raw.get("_test", "")
+        return ParameterView(key, self._params[key], self._test_name)
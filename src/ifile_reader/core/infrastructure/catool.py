@@ -1,7 +1,7 @@
+import io
 import os
 import platform
 import sys
-import tempfile
 import zipfile
 import urllib.request
 import subprocess
@@ -27,6 +27,24 @@ class CatoolRunner:
     def _exe_name() -> str:
         return "catool.exe" if platform.system() == "Windows" else "catool"
 
+    @staticmethod
+    def _find_file(root: Path, name: str) -> Optional[Path]:
+        # Iterative scandir walk that stops at the first match, instead of
+        # materializing a full recursive glob of the extraction tree.
+        stack = [str(root)]
+        while stack:
+            d = stack.pop()
+            try:
+                with os.scandir(d) as it:
+                    for e in it:
+                        if e.is_dir(follow_symlinks=False):
+                            stack.append(e.path)
+                        elif e.name == name and e.is_file():
+                            return Path(e.path)
+            except OSError:
+                continue
+        return None
+
     @classmethod
     def _download_url(cls) -> str:
         is64 = cls._is_64bit()
@@ -63,30 +81,27 @@ class CatoolRunner:
             raise FileNotFoundError("catool executable not found and download_if_missing is False")
 
         url = self._download_url()
-        fd, tmp_zip = tempfile.mkstemp(suffix=".zip")
-        os.close(fd)
-        tmp_zip_path = Path(tmp_zip)
 
         logger.info(f"Downloading latest catool from {url}...")
-        try:
-            urllib.request.urlretrieve(url, str(tmp_zip_path))
-            with zipfile.ZipFile(tmp_zip_path, "r") as zf:
-                zf.extractall(lib_dir)
-
-            for f in lib_dir.rglob(self._exe_name()):
-                try:
-                    if platform.system() in ("Linux", "Darwin"):
-                        f.chmod(0o755)
-                except Exception:
-                    pass
-                return f
-
+        # The archive is small (tens of MB), so buffer it in memory and extract
+        # directly instead of round-tripping through a temp file on disk.
+        with urllib.request.urlopen(url) as resp:
+            buf = io.BytesIO(resp.read())
+        with zipfile.ZipFile(buf, "r") as zf:
+            zf.extractall(lib_dir)
+
+        f = self._find_file(lib_dir, self._exe_name())
+        if f is None:
             raise RuntimeError(f"catool was not found after extraction in {lib_dir}")
-        finally:
-            tmp_zip_path.unlink(missing_ok=True)
+        try:
+            if platform.system() in ("Linux", "Darwin"):
+                f.chmod(0o755)
+        except Exception:
+            pass
+        return f
 
 
-    def run(self, script: Path, *, log_level: str, timeout: Optional[int]) -> None:
+    def run(self, script: Path, *, log_level: str, timeout: Optional[int], stdin=None) -> None:
         exe_path = self.ensure_executable()
         env = os.environ.copy()
         try:
@@ -100,23 +115,44 @@ class CatoolRunner:
         cmd = [str(exe_path), f"--debug-level={log_level}", str(script)]
         logger.debug("Running catool: %s", " ".join(cmd))
 
-        proc = subprocess.run(cmd, capture_output=True, timeout=timeout, check=False, env=env)
-        if proc.stdout:
-            try:
-                logger.debug(f"catool stdout:\n{proc.stdout.decode('utf-8', errors='ignore')}")
-            except Exception:
-                logger.debug("catool stdout contained undecodable bytes (suppressed)")
-        if proc.stderr:
+        if stdin is None:
+            proc = subprocess.run(cmd, capture_output=True, timeout=timeout, check=False, env=env)
+            returncode, out, err = proc.returncode, proc.stdout, proc.stderr
+        else:
+            # stdin is typically a ZipExtFile, which has no fileno() and so
+            # cannot be handed to subprocess directly; spool it through a
+            # pipe instead.
+            popen = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env)
             try:
-                logger.debug(f"catool stderr:\n{proc.stderr.decode('utf-8', errors='ignore')}")
-            except Exception:
-                logger.debug("catool stderr contained undecodable bytes (suppressed)")
-
-        if proc.returncode != 0:
+                try:
+                    shutil.copyfileobj(stdin, popen.stdin, length=1 << 20)
+                except BrokenPipeError:
+                    # catool exited before consuming everything; its return
+                    # code and stderr carry the actual diagnosis.
+                    pass
+                # communicate() flushes and closes stdin for us.
+                out, err = popen.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                popen.kill()
+                popen.communicate()
+                raise
+            returncode = popen.returncode
+
+        # Decode lazily: catool can emit megabytes of log output, and at INFO
+        # level and above nobody reads it.
+        if logger.isEnabledFor(logging.DEBUG):
+            if out:
+                logger.debug("catool stdout:\n%s", out.decode("utf-8", errors="ignore"))
+            if err:
+                logger.debug("catool stderr:\n%s", err.decode("utf-8", errors="ignore"))
+
+        if returncode != 0:
+            stdout = out.decode("utf-8", errors="ignore") if out else ""
+            stderr = err.decode("utf-8", errors="ignore") if err else ""
             raise RuntimeError(
                 "catool did not exit successfully\n"
                 f"Command: {' '.join(cmd)}\n"
-                f"Return code: {proc.returncode}\n"
-                f"STDOUT:\n{proc.stdout}\n"
-                f"STDERR:\n{proc.stderr}\n"
+                f"Return code: {returncode}\n"
+                f"STDOUT:\n{stdout}\n"
+                f"STDERR:\n{stderr}\n"
             )
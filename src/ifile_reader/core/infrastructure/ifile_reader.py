@@ -1,10 +1,17 @@
+import atexit
 import logging
+import mmap
+import os
+import pickle
 import shutil
 import time
 import zipfile
 import tempfile
 import numpy as np
+from uuid import uuid4
 from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from scipy.io.matlab import mio5_params
 from contextlib import nullcontext
 from scipy.io import loadmat, whosmat
@@ -14,16 +21,103 @@ from ifile_reader.core.infrastructure.catool import CatoolRunner
 
 logger = logging.getLogger(__name__)
 
+_MAT_STRUCT = mio5_params.mat_struct
+_META_KEYS = ("__header__", "__version__", "__globals__")
+
+# Static catool script skeleton; slots are input file, optional extra channel
+# directives, output file and optional output directives. Kept as bytes so
+# each run is one format + write.
+_SCRIPT_TEMPLATE = (
+    b'locale ".utf8"\n'
+    b"input-file-type AVL_IFILE\n"
+    b"input-data ALL\n"
+    b'input-file "%b"\n'
+    b"load-channels all\n"
+    b"load-file\n"
+    b"%b"
+    b"analyse none\n"
+    b"run-analysis\n"
+    b'output-file "%b"\n'
+    b"output-data ALL\n"
+    b"output-file-type MATLAB\n"
+    b"%b"
+    b"output\n"
+)
+_OFFSET_NONE_LINE = b"channel all channel-offset type NONE\n"
+_NO_COMPRESSION_LINE = b"output-compression NONE\n"
+
+
+class _ArrayRef:
+    """Placeholder for an ndarray moved out-of-band in a protocol-5 payload."""
+
+    __slots__ = ("index", "dtype", "shape", "order")
+
+    def __init__(self, index: int, dtype: str, shape: tuple, order: str):
+        self.index = index
+        self.dtype = dtype
+        self.shape = shape
+        self.order = order
+
+
+class _ScratchDir:
+    """Context-managed subdirectory of a reused workdir; removed on exit."""
+
+    def __init__(self, path: Path):
+        self._path = path
+
+    def __enter__(self) -> str:
+        self._path.mkdir(parents=True, exist_ok=True)
+        return str(self._path)
+
+    def __exit__(self, *exc) -> None:
+        shutil.rmtree(self._path, ignore_errors=True)
+
 
 class IFileReader:
-    def __init__(self, runner: Optional[CatoolRunner] = None, keep_temp_files: bool = False):
+    def __init__(self, runner: Optional[CatoolRunner] = None, keep_temp_files: bool = False, reuse_workdir: bool = False, n_workers: int = 1, compressed_mat: bool = True):
         self.runner = runner or CatoolRunner()
         self.keep_temp_files = keep_temp_files
+        self.n_workers = n_workers
+        # Uncompressed MAT trades roughly 2x temp-disk for skipping zlib
+        # inflation on load, which keeps the mmap read path zero-decompress.
+        self.compressed_mat = compressed_mat
+
+        # With reuse_workdir, scratch dirs are nested under one long-lived
+        # directory so batch loads do not create/tear down a TemporaryDirectory
+        # (and its prefix entropy) per call.
+        self._workdir: Optional[Path] = None
+        if reuse_workdir:
+            self._workdir = Path(tempfile.mkdtemp(prefix="ifile_reader_"))
+            atexit.register(shutil.rmtree, self._workdir, ignore_errors=True)
 
         self._last_mat: Optional[Path] = None
         self._last_run_script: Optional[Path] = None
         self._last_preserved_dir: Optional[Path] = None
 
+    def _scratch_dir(self, prefix: str):
+        if self._workdir is None:
+            return tempfile.TemporaryDirectory(prefix=prefix)
+        return _ScratchDir(self._workdir.joinpath(f"{prefix}{uuid4().hex}"))
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _level_to_catool(level: int) -> str:
+        if level <= logging.DEBUG:
+            return "DEBUG"
+        if level <= logging.INFO:
+            return "INFO"
+        if level <= logging.WARNING:
+            return "WARNING"
+        return "SILENT"
+
+    @staticmethod
+    def _select_zip_member(zf: zipfile.ZipFile) -> zipfile.ZipInfo:
+        # catool consumes a single ifile; the largest member is the payload.
+        members = [info for info in zf.infolist() if not info.is_dir()]
+        if not members:
+            raise RuntimeError("Archive contains no files")
+        return max(members, key=lambda info: info.file_size)
+
     def load_ifile(
         self,
         filename: Union[str, Path],
@@ -35,62 +129,49 @@ class IFileReader:
         loadmat_kwargs: Optional[dict[str, object]] = None,
     ) -> dict[str, Any]:
 
-        if logger.isEnabledFor(logging.DEBUG):
-            catool_level = "DEBUG"
-        elif logger.isEnabledFor(logging.INFO):
-            catool_level = "INFO"
-        elif logger.isEnabledFor(logging.WARNING):
-            catool_level = "WARNING"
-        else:
-            catool_level = "SILENT"
+        catool_level = self._level_to_catool(logger.getEffectiveLevel())
 
         filename_path = Path(filename).expanduser().resolve()
         if not filename_path.is_file():
             raise FileNotFoundError(str(filename_path))
 
-        unzip_ctx = tempfile.TemporaryDirectory(prefix="ifile_unzip_") if zipfile.is_zipfile(filename_path) else nullcontext(None)
+        is_zip = zipfile.is_zipfile(filename_path)
+        pipe_from_zip = is_zip and getattr(self.runner.config, "supports_stdin", False)
+
+        unzip_ctx = self._scratch_dir("ifile_unzip_") if is_zip and not pipe_from_zip else nullcontext(None)
         with unzip_ctx as unzip_dir_raw:
-            if unzip_dir_raw:
+            if pipe_from_zip:
+                # catool reads the payload from stdin; no temp-file extraction.
+                input_file = "-"
+            elif unzip_dir_raw:
                 unzip_dir = Path(unzip_dir_raw)
                 with zipfile.ZipFile(filename_path, "r") as zf:
-                    zf.extractall(unzip_dir)
-                extracted_files = sorted(p for p in unzip_dir.rglob("*") if p.is_file())
-                if not extracted_files:
-                    raise RuntimeError("Archive contains no files")
-                input_file = extracted_files[0]
+                    member = self._select_zip_member(zf)
+                    input_file = unzip_dir.joinpath(Path(member.filename).name)
+                    with zf.open(member) as src, open(input_file, "wb") as dst:
+                        shutil.copyfileobj(src, dst, length=1 << 20)
                 logger.debug(f"Zip contained files, using {input_file}")
             else:
                 input_file = filename_path
 
-            with tempfile.TemporaryDirectory(prefix="catool_run_") as run_dir_raw:
+            with self._scratch_dir("catool_run_") as run_dir_raw:
                 run_dir = Path(run_dir_raw)
                 script_path = run_dir.joinpath("run.ccf")
                 mat_path = run_dir.joinpath("output.mat")
 
-                script_lines = [
-                    'locale ".utf8"',
-                    "input-file-type AVL_IFILE",
-                    "input-data ALL",
-                    f'input-file "{input_file}"',
-                    "load-channels all",
-                    "load-file",
-                ]
-
-                if not offset_correction:
-                    script_lines.append("channel all channel-offset type NONE")
-
-                script_lines += [
-                    "analyse none",
-                    "run-analysis",
-                    f'output-file "{mat_path}"',
-                    f"output-data ALL",
-                    "output-file-type MATLAB",
-                    "output",
-                    "",
-                ]
-
-                script_path.write_text("\n".join(script_lines), encoding="utf-8")
-                self.runner.run(script_path, log_level=catool_level, timeout=self.runner.config.subprocess_timeout)
+                script_path.write_bytes(
+                    _SCRIPT_TEMPLATE % (
+                        os.fsencode(str(input_file)),
+                        b"" if offset_correction else _OFFSET_NONE_LINE,
+                        os.fsencode(str(mat_path)),
+                        b"" if self.compressed_mat else _NO_COMPRESSION_LINE,
+                    )
+                )
+                if pipe_from_zip:
+                    with zipfile.ZipFile(filename_path, "r") as zf, zf.open(self._select_zip_member(zf)) as src:
+                        self.runner.run(script_path, log_level=catool_level, timeout=self.runner.config.subprocess_timeout, stdin=src)
+                else:
+                    self.runner.run(script_path, log_level=catool_level, timeout=self.runner.config.subprocess_timeout)
 
                 if not mat_path.exists():
                     logger.error(f"Expected MAT file {mat_path} not found after running catool")
@@ -102,7 +183,12 @@ class IFileReader:
                         lib_dir = Path(getattr(self.runner.config, "lib_dir", Path.cwd()))
                         preserved = lib_dir.joinpath(f"catool_run_{int(time.time())}")
                         preserved.mkdir(parents=True, exist_ok=True)
-                        shutil.copytree(run_dir, preserved, dirs_exist_ok=True)
+                        # Hard-link on the same filesystem: the MAT payload
+                        # survives the temp-dir cleanup without re-copying
+                        # its bytes. Cross-device falls back to a real copy.
+                        same_dev = os.stat(preserved).st_dev == os.stat(run_dir).st_dev
+                        copy_fn = os.link if same_dev else shutil.copy2
+                        shutil.copytree(run_dir, preserved, dirs_exist_ok=True, copy_function=copy_fn)
                         preserved_dir = preserved
                         logger.info(f"Preserved run directory at {preserved_dir}")
                     except Exception:
@@ -112,83 +198,183 @@ class IFileReader:
                 self._last_run_script = script_path
                 self._last_preserved_dir = preserved_dir
 
-                vars_info = whosmat(str(mat_path))
-                available_vars = {name for name, *_ in vars_info}
-                logger.debug("MAT variables: %s", ", ".join(sorted(available_vars)))
-
-                if channels:
-                    requested = [c for c in channels if c in available_vars]
-                    missing = [c for c in channels if c not in available_vars]
-                    if missing:
-                        logger.warning(f"Requested channels not in MAT: {missing}")
-                    if len(requested) == 0:
-                        requested = None
-                else:
+                # Open once: whosmat and loadmat both accept file objects, so
+                # share the handle instead of re-opening and re-parsing the
+                # header. Read through a read-only mmap where possible so
+                # scipy's many small seeks/reads hit mapped pages instead of
+                # buffered-IO syscalls.
+                with open(mat_path, "rb") as raw_fh:
+                    try:
+                        fh = mmap.mmap(raw_fh.fileno(), 0, access=mmap.ACCESS_READ)
+                    except (ValueError, OSError):
+                        fh = raw_fh
+
                     requested = None
+                    # whosmat is a full header parse; only pay for it when we
+                    # must report missing channels or debug-log the contents.
+                    # loadmat itself silently ignores absent variable names.
+                    validate_channels = bool(channels) and logger.isEnabledFor(logging.WARNING)
+                    if validate_channels or logger.isEnabledFor(logging.DEBUG):
+                        vars_info = whosmat(fh)
+                        available_vars = {name for name, *_ in vars_info}
+                        logger.debug("MAT variables: %s", ", ".join(sorted(available_vars)))
+                        fh.seek(0)
 
-                kwargs = {"squeeze_me": True, "struct_as_record": False}
-                if loadmat_kwargs:
-                    kwargs.update(loadmat_kwargs)
+                        if validate_channels:
+                            requested = tuple(c for c in channels if c in available_vars)
+                            if len(requested) != len(channels):
+                                logger.warning(f"Requested channels not in MAT: {[c for c in channels if c not in available_vars]}")
+                            if len(requested) == 0:
+                                requested = None
+                    elif channels:
+                        requested = tuple(channels)
 
-                raw = loadmat(str(mat_path), variable_names=requested, **kwargs) if requested else loadmat(str(mat_path), **kwargs)
+                    kwargs = {"squeeze_me": True, "struct_as_record": False}
+                    if loadmat_kwargs:
+                        kwargs.update(loadmat_kwargs)
+
+                    raw = loadmat(fh, variable_names=requested, **kwargs) if requested else loadmat(fh, **kwargs)
+                    if requested and not any(k not in _META_KEYS for k in raw):
+                        # loadmat silently drops absent names; when nothing at
+                        # all matched, fall back to a full load so the result
+                        # matches what the validated path returns.
+                        logger.warning(f"Requested channels not in MAT: {list(channels)}")
+                        fh.seek(0)
+                        raw = loadmat(fh, **kwargs)
+                    if fh is not raw_fh:
+                        fh.close()
                 return self.simplify_loadmat_dict(raw, convert_arrays) if simplify else raw
 
 
     def simplify_loadmat_dict(self, mat_dict: dict[str, Any], convert_arrays: bool = False) -> dict[str, Any]:
-        out: dict[str, Any] = {}
-        for k, v in mat_dict.items():
-            if k in ("__header__", "__version__", "__globals__"):
-                out[k] = v
-                continue
-            out[k] = self._convert_matobj(v, convert_arrays)
-        return out
-
-
-    def _is_matstruct(self, obj: object) -> bool:
-        try:
-            return isinstance(obj, mio5_params.mat_struct)
-        except Exception:
-            return False
-
-
-    def _decode_bytes(self, x: object) -> object:
-        if isinstance(x, (bytes, bytearray)):
-            try:
-                return x.decode("utf-8", errors="ignore")
-            except Exception:
-                return x
-        return x
-
-
-    def _ndarray_to_py(self, x: np.ndarray, convert_arrays: bool) -> object:
-        if x.dtype == object:
-            py = x.tolist()
-            return self._convert_matobj(py, convert_arrays)
-        if convert_arrays:
-            return self._convert_matobj(x.tolist(), convert_arrays)
-        if x.size == 1:
-            try:
-                return x.item()
-            except Exception:
-                return x
-        return x
+        # Pure-numeric MAT dicts need no conversion at all; detect that with
+        # cheap type checks and hand the dict back untouched.
+        if not convert_arrays and not any(
+            self._needs_conversion(v)
+            for k, v in mat_dict.items()
+            if k not in _META_KEYS
+        ):
+            return mat_dict
+
+        keys = [k for k in mat_dict if k not in _META_KEYS]
+        if self.n_workers > 1 and len(keys) > 4:
+            # One top-level struct per channel; subtrees convert independently
+            # and the ndarray-heavy leaves release the GIL inside numpy.
+            with ThreadPoolExecutor(max_workers=self.n_workers) as ex:
+                for k, converted in zip(keys, ex.map(
+                    lambda v: self._convert_matobj(v, convert_arrays),
+                    [mat_dict[k] for k in keys],
+                )):
+                    mat_dict[k] = converted
+            return mat_dict
+
+        # loadmat's dict is ours to keep, so convert values in place instead
+        # of rebuilding an N-entry dict; meta keys stay untouched.
+        for k in keys:
+            mat_dict[k] = self._convert_matobj(mat_dict[k], convert_arrays)
+        return mat_dict
+
+
+    @staticmethod
+    def to_protocol5_payload(result: Any) -> tuple[Any, list[pickle.PickleBuffer]]:
+        """
+        Split a loaded ifile dict into a picklable structure and out-of-band
+        PickleBuffers so large channel arrays cross process boundaries without
+        a bytes copy. Pickle the structure with pickle.dumps(structure,
+        protocol=5) — no buffer_callback, or extra buffers would land after
+        the _ArrayRef-indexed ones and break the indices — and rebuild with
+        from_protocol5_payload.
+        """
+        buffers: list[pickle.PickleBuffer] = []
+
+        def walk(obj: Any) -> Any:
+            # loadmat hands back channel arrays F-contiguous, so both layouts
+            # must go out-of-band; the ref records which one to rebuild with.
+            if isinstance(obj, np.ndarray) and obj.dtype != object and (
+                obj.flags["C_CONTIGUOUS"] or obj.flags["F_CONTIGUOUS"]
+            ):
+                order = "C" if obj.flags["C_CONTIGUOUS"] else "F"
+                buffers.append(pickle.PickleBuffer(obj))
+                return _ArrayRef(len(buffers) - 1, obj.dtype.str, obj.shape, order)
+            if isinstance(obj, dict):
+                return {k: walk(v) for k, v in obj.items()}
+            if isinstance(obj, list):
+                return [walk(elem) for elem in obj]
+            return obj
+
+        return walk(result), buffers
+
+    @staticmethod
+    def from_protocol5_payload(structure: Any, buffers: list) -> Any:
+        def walk(obj: Any) -> Any:
+            if isinstance(obj, _ArrayRef):
+                buf = buffers[obj.index]
+                if isinstance(buf, pickle.PickleBuffer):
+                    # raw() flattens the view; frombuffer refuses an F-order
+                    # memoryview even though the bytes are contiguous.
+                    buf = buf.raw()
+                flat = np.frombuffer(buf, dtype=obj.dtype)
+                return flat.reshape(obj.shape, order=obj.order)
+            if isinstance(obj, dict):
+                return {k: walk(v) for k, v in obj.items()}
+            if isinstance(obj, list):
+                return [walk(elem) for elem in obj]
+            return obj
+
+        return walk(structure)
+
+    @staticmethod
+    def _needs_conversion(v: object) -> bool:
+        if isinstance(v, np.ndarray):
+            return v.dtype == object or v.size == 1
+        return isinstance(v, (_MAT_STRUCT, list, np.generic, bytes, bytearray))
 
 
     def _convert_matobj(self, matobj: object, convert_arrays: bool = False) -> object:
-        if self._is_matstruct(matobj):
-            result: dict = {}
-            for fn in getattr(matobj, "_fieldnames", []):
-                result[fn] = self._convert_matobj(getattr(matobj, fn), convert_arrays)
-            return result
-        if isinstance(matobj, list):
-            return [self._convert_matobj(elem, convert_arrays) for elem in matobj]
-        if isinstance(matobj, np.ndarray):
-            return self._ndarray_to_py(matobj, convert_arrays)
-        if isinstance(matobj, (np.generic,)):
-            try:
-                return matobj.item()
-            except Exception:
-                return matobj
-        if isinstance(matobj, (bytes, bytearray)):
-            return self._decode_bytes(matobj)
-        return matobj
\ No newline at end of file
+        # Iterative worklist instead of recursion: deep MAT trees would pay a
+        # Python frame per node and can hit the recursion limit. Containers
+        # are allocated up front and filled as their children are popped.
+        holder: list = [matobj]
+        stack: list = [(holder, 0, matobj)]
+        while stack:
+            parent, key, obj = stack.pop()
+            if isinstance(obj, _MAT_STRUCT):
+                result: dict = {}
+                parent[key] = result
+                # mat_struct keeps fields 1:1 in __dict__, so plain dict
+                # lookups beat per-field getattr; reversed so the popped
+                # order preserves field order
+                d = obj.__dict__
+                for fn in reversed(getattr(obj, "_fieldnames", [])):
+                    stack.append((result, fn, d[fn]))
+            elif isinstance(obj, list):
+                out = [None] * len(obj)
+                parent[key] = out
+                for i, elem in enumerate(obj):
+                    stack.append((out, i, elem))
+            elif isinstance(obj, np.ndarray):
+                if obj.dtype == object and obj.ndim == 1:
+                    # push elements directly; tolist() would build the same
+                    # list a second time just to throw the first one away
+                    out = [None] * obj.shape[0]
+                    parent[key] = out
+                    for i in range(obj.shape[0]):
+                        stack.append((out, i, obj[i]))
+                elif obj.dtype == object or convert_arrays:
+                    stack.append((parent, key, obj.tolist()))
+                elif obj.size == 1:
+                    # flat[0] cannot fail on a size-1 array, so no try/except
+                    v = obj.flat[0]
+                    parent[key] = v.item() if isinstance(v, np.generic) else v
+                else:
+                    parent[key] = obj
+            elif isinstance(obj, np.generic):
+                try:
+                    parent[key] = obj.item()
+                except Exception:
+                    parent[key] = obj
+            elif isinstance(obj, (bytes, bytearray)):
+                parent[key] = obj.decode("utf-8", "ignore")
+            else:
+                parent[key] = obj
+        return holder[0]
\ No newline at end of file